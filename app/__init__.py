@@ -4,8 +4,11 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
 import os
 from flask_migrate import Migrate
+from sqlalchemy import event
 import hashlib
 
+from app.utils.json_provider import ORJSONProvider
+
 # Initialize extensions
 db = SQLAlchemy()
 login_manager = LoginManager()
@@ -13,13 +16,30 @@ login_manager.login_view = 'auth.login'
 migrate = Migrate()
 
 
-def create_app(config_name='default'):
-    """Application factory function"""
+def _configure_sqlite_connection(dbapi_connection, connection_record):
+    """Use WAL journaling so commits don't fsync the database file every time"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.close()
+
+
+def create_app(config_name='default', load_models=True):
+    """
+    Application factory function
+
+    Args:
+        config_name (str): Key into app.config.config
+        load_models (bool): Register the speech and Q&A parts of the app, which
+            import the ML libraries. Scripts that only touch the database pass False.
+    """
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
 
     # Load configuration
     from app.config import config
     app.config.from_object(config[config_name])
+    config[config_name].init_app(app)
 
     # Ensure the upload directory exists
     os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
@@ -32,15 +52,22 @@ def create_app(config_name='default'):
     # Import and register blueprints
     from app.routes.auth import auth_bp
     from app.routes.main import main_bp
-    from app.routes.speech import speech_bp
-    from app.routes.transcribe import transcribe_bp  # Import new blueprint
-    from app.routes.qa import qa_bp  # Import Q&A blueprint
 
     app.register_blueprint(auth_bp)
     app.register_blueprint(main_bp)
-    app.register_blueprint(speech_bp)
-    app.register_blueprint(transcribe_bp)  # Register new blueprint
-    app.register_blueprint(qa_bp)  # Register Q&A blueprint
+
+    if load_models:
+        # Snapshot the Q&A settings into the service module
+        from app.services import qa_service
+        qa_service.init_app(app)
+
+        from app.routes.speech import speech_bp
+        from app.routes.transcribe import transcribe_bp  # Import new blueprint
+        from app.routes.qa import qa_bp  # Import Q&A blueprint
+
+        app.register_blueprint(speech_bp)
+        app.register_blueprint(transcribe_bp)  # Register new blueprint
+        app.register_blueprint(qa_bp)  # Register Q&A blueprint
 
     # Set up user loader for Flask-Login
     from app.models.user import User
@@ -51,8 +78,16 @@ def create_app(config_name='default'):
 
     # Create database tables if they don't exist
     with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            event.listen(db.engine, 'connect', _configure_sqlite_connection)
         db.create_all()
 
+    # Load the Q&A model now rather than on the first question
+    if load_models and app.config.get('QA_PRELOAD_MODEL'):
+        from app.services.qa_service import preload_model
+        with app.app_context():
+            preload_model()
+
     # Add template context processors
     @app.context_processor
     def inject_now():
@@ -0,0 +1,20 @@
+# app/_singleton.py
+"""
+Process-wide Flask application shared by the command line scripts
+"""
+import os
+
+# Must be set before qa_service imports transformers
+os.environ.setdefault('TOKENIZERS_PARALLELISM', 'true')
+os.environ.setdefault('TRANSFORMERS_NO_ADVISORY_WARNINGS', '1')
+
+_app = None
+
+
+def get_app():
+    """Create the application on first use and return the same instance afterwards"""
+    global _app
+    if _app is None:
+        from app import create_app
+        _app = create_app()
+    return _app
@@ -5,6 +5,27 @@ from datetime import timedelta
 basedir = os.path.abspath(os.path.dirname(__file__))
 
 
+def _engine_options(database_uri):
+    """SQLAlchemy engine (connection pool) options for the given database"""
+    if database_uri.startswith('sqlite'):
+        # SQLite has no server connections to pool; Flask-SQLAlchemy already
+        # switches in-memory databases to a StaticPool
+        return {}
+
+    if os.environ.get('DATABASE_EXTERNAL_POOL', 'false').lower() in ('1', 'true', 'yes'):
+        # Connections are pooled outside the app (e.g. pgbouncer), so don't pool twice
+        from sqlalchemy.pool import NullPool
+        return {'poolclass': NullPool, 'pool_pre_ping': True}
+
+    return {
+        'pool_size': int(os.environ.get('DATABASE_POOL_SIZE', '10')),
+        'max_overflow': int(os.environ.get('DATABASE_MAX_OVERFLOW', '20')),
+        'pool_timeout': 30,
+        'pool_pre_ping': True,  # Transparently replace connections dropped by the server
+        'pool_recycle': 1800
+    }
+
+
 class Config:
     """Base configuration class"""
     # Flask settings
@@ -33,6 +54,13 @@ class Config:
     QA_MAX_ANSWER_LENGTH = int(os.environ.get('QA_MAX_ANSWER_LENGTH', '200'))
     QA_CHUNK_SIZE = int(os.environ.get('QA_CHUNK_SIZE', '350'))
     QA_CHUNK_OVERLAP = int(os.environ.get('QA_CHUNK_OVERLAP', '75'))
+    QA_QUANTIZE = os.environ.get('QA_QUANTIZE', 'true').lower() in ('1', 'true', 'yes')  # int8 dynamic quantization
+    QA_USE_ONNX = os.environ.get('QA_USE_ONNX', 'false').lower() in ('1', 'true', 'yes')  # Requires optimum[onnxruntime]
+    QA_ONNX_MODEL_DIR = os.environ.get('QA_ONNX_MODEL_DIR') or os.path.join(os.path.dirname(basedir), 'models')
+    QA_NUM_THREADS = int(os.environ.get('QA_NUM_THREADS', '0'))  # torch intra-op threads, 0 = half the cores
+    QA_TOP_K_CHUNKS = int(os.environ.get('QA_TOP_K_CHUNKS', '4'))  # Most relevant chunks per question, 0 = all
+    QA_EMBED_MULTI_PROCESS = os.environ.get('QA_EMBED_MULTI_PROCESS', 'false').lower() in ('1', 'true', 'yes')  # Embedding worker processes
+    QA_PRELOAD_MODEL = os.environ.get('QA_PRELOAD_MODEL', 'false').lower() in ('1', 'true', 'yes')  # Load at startup
     
     @staticmethod
     def init_app(app):
@@ -45,6 +73,7 @@ class DevelopmentConfig(Config):
     DEBUG = True
     SQLALCHEMY_DATABASE_URI = os.environ.get('DEV_DATABASE_URL') or \
                               'sqlite:///' + os.path.join(os.path.dirname(basedir), 'dev.db')
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options(SQLALCHEMY_DATABASE_URI)
     LOG_LEVEL = 'DEBUG'  # Added from new implementation
 
 
@@ -53,6 +82,7 @@ class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = os.environ.get('TEST_DATABASE_URL') or \
                               'sqlite:///' + os.path.join(os.path.dirname(basedir), 'test.db')
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options(SQLALCHEMY_DATABASE_URI)
     WTF_CSRF_ENABLED = False
     UPLOAD_FOLDER = os.path.join(os.path.dirname(basedir), 'test_uploads')
 
@@ -61,8 +91,10 @@ class ProductionConfig(Config):
     """Production configuration"""
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
                               'sqlite:///' + os.path.join(os.path.dirname(basedir), 'app.db')
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options(SQLALCHEMY_DATABASE_URI)
     REMEMBER_COOKIE_SECURE = True
     SESSION_COOKIE_SECURE = True
+    QA_PRELOAD_MODEL = os.environ.get('QA_PRELOAD_MODEL', 'true').lower() in ('1', 'true', 'yes')
 
 
 # Configuration dictionary
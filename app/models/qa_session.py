@@ -6,6 +6,10 @@ from app import db
 class QASession(db.Model):
     """Q&A Session model for storing questions and answers about transcripts"""
     __tablename__ = 'qa_sessions'
+    __table_args__ = (
+        # Covers the per-recording history lookup, ordered newest first
+        db.Index('ix_qa_recording_user_created', 'recording_id', 'user_id', 'created_at'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     recording_id = db.Column(db.Integer, db.ForeignKey('recordings.id'), nullable=False)
@@ -35,7 +39,7 @@ class QASession(db.Model):
             'question': self.question,
             'answer': self.answer,
             'confidence_score': self.confidence_score,
-            'created_at': self.created_at.isoformat()
+            'created_at': self.created_at  # Serialized as ISO 8601 by the app's orjson provider
         }
 
     def __repr__(self):
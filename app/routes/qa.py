@@ -1,5 +1,6 @@
 # app/routes/qa.py
-from flask import Blueprint, render_template, request, jsonify, flash, redirect, url_for
+from datetime import datetime
+from flask import Blueprint, render_template, request, jsonify, flash, redirect, url_for, current_app, stream_with_context
 from flask_login import login_required, current_user
 from app.models.recording import Recording
 from app.models.qa_session import QASession
@@ -88,25 +89,71 @@ def ask_question():
         db.session.rollback()
         return jsonify({'error': f'Error processing question: {str(e)}'}), 500
 
+def _history_cursor(qa_session):
+    """Build the keyset pagination cursor pointing just past a Q&A session"""
+    return f"{qa_session.created_at.isoformat()}_{qa_session.id}"
+
 @qa_bp.route('/history/<int:recording_id>')
 @login_required
 def qa_history(recording_id):
-    """Get Q&A history for a recording"""
+    """
+    Get Q&A history for a recording, newest first
+    
+    Query parameters:
+        limit (int): Page size, the whole history is returned when omitted
+        cursor (str): The next_cursor value returned with the previous page
+    """
     recording = Recording.query.get_or_404(recording_id)
     
     # Ensure the user can only access their own recordings
     if recording.user_id != current_user.id:
         return jsonify({'error': 'Permission denied'}), 403
     
-    qa_sessions = QASession.query.filter_by(
+    limit = request.args.get('limit', type=int)
+    if limit is not None and limit < 1:
+        return jsonify({'error': 'limit must be a positive integer'}), 400
+    
+    query = QASession.query.filter_by(
         recording_id=recording_id,
         user_id=current_user.id
-    ).order_by(QASession.created_at.desc()).all()
+    )
     
-    return jsonify({
-        'success': True,
-        'qa_sessions': [session.to_dict() for session in qa_sessions]
-    })
+    cursor = request.args.get('cursor')
+    if cursor:
+        try:
+            created_at, _, last_id = cursor.rpartition('_')
+            created_at = datetime.fromisoformat(created_at)
+            last_id = int(last_id)
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+        
+        # Keyset pagination: continue strictly after the last session sent
+        query = query.filter(db.or_(
+            QASession.created_at < created_at,
+            db.and_(QASession.created_at == created_at, QASession.id < last_id)
+        ))
+    
+    query = query.order_by(QASession.created_at.desc(), QASession.id.desc())
+    if limit is not None:
+        query = query.limit(limit + 1)  # One extra row tells us whether another page exists
+    
+    def generate():
+        # Stream sessions as they are fetched instead of building the whole list in memory
+        yield '{"success": true, "qa_sessions": ['
+        
+        last_session = None
+        has_more = False
+        for count, qa_session in enumerate(query.yield_per(100)):
+            if limit is not None and count == limit:
+                has_more = True
+                break
+            yield (',' if count else '') + current_app.json.dumps(qa_session.to_dict())
+            last_session = qa_session
+        
+        next_cursor = _history_cursor(last_session) if has_more else None
+        yield '], "next_cursor": ' + current_app.json.dumps(next_cursor) + '}'
+    
+    return current_app.response_class(stream_with_context(generate()), mimetype='application/json')
 
 @qa_bp.route('/delete/<int:qa_session_id>', methods=['DELETE'])
 @login_required
@@ -142,7 +189,11 @@ def get_suggestions(recording_id):
     
     suggested_questions = generate_suggested_questions(transcript)
     
-    return jsonify({
+    response = jsonify({
         'success': True,
         'suggestions': suggested_questions
-    })
\ No newline at end of file
+    })
+    # Suggestions don't change; private since the route requires a login
+    response.cache_control.private = True
+    response.cache_control.max_age = 3600
+    return response
\ No newline at end of file
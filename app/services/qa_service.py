@@ -1,85 +1,487 @@
 # app/services/qa_service.py
 import torch
-from transformers import AutoTokenizer, AutoModelForQuestionAnswering, pipeline
+from transformers import AutoTokenizer, AutoModelForQuestionAnswering
 from flask import current_app
+import os
 import re
 import string
+import hashlib
+import threading
+import functools
+import atexit
+from collections import OrderedDict, namedtuple
+import numpy as np
+
+# Q&A settings, snapshotted from the Flask config by init_app() so the hot
+# paths don't go through current_app. These defaults apply outside Flask.
+QA_MODEL = 'distilbert-base-cased-distilled-squad'
+QA_CONFIDENCE_THRESHOLD = 0.05
+QA_MAX_ANSWER_LENGTH = 200
+QA_CHUNK_SIZE = 350
+QA_CHUNK_OVERLAP = 75
+QA_QUANTIZE = True
+QA_USE_ONNX = False
+QA_ONNX_MODEL_DIR = 'models'
+QA_NUM_THREADS = 0  # 0 uses half the CPU cores
+QA_TOP_K_CHUNKS = 4  # Chunks kept per question after ranking, 0 keeps every chunk
+QA_EMBED_MULTI_PROCESS = False  # Embed long transcripts' chunks in worker processes
 
 # Global variables for lazy loading
 _qa_model = None
 _qa_tokenizer = None
-_qa_pipeline = None
+_embedding_model = None
+_embedding_unavailable = False
+_embedding_model_lock = threading.Lock()
+_embedding_pool = None
+_embedding_pool_unavailable = False
+_embedding_pool_lock = threading.Lock()
+_qa_model_lock = threading.Lock()
+
+# Semantic answer cache: sha1(transcript) -> list of (embedding, question, result)
+_EMBEDDING_MODEL_NAME = 'sentence-transformers/all-MiniLM-L6-v2'
+_EMBED_MULTI_PROCESS_MIN_TEXTS = 16  # Fewer texts don't pay back sending them to the worker processes
+_EMBED_MAX_PROCESSES = 4  # Single-threaded embedding workers, at most one per two logical cores
+_QA_CACHE_MAXSIZE = 1024  # Number of transcripts kept, least recently used evicted first
+_QA_CACHE_MAX_ENTRIES = 64  # Number of questions kept per transcript
+_QA_CACHE_SIMILARITY = 0.85
+_QA_COMBINE_SINGLE_SIMILARITY = 0.75  # Every sub-question must match at least this well
+_QA_COMBINE_TOTAL_SIMILARITY = 1.5  # And the matches must add up to at least this
+_COMPOUND_SPLIT_RE = re.compile(r'\s*(?:;|\band\b)\s*', re.IGNORECASE)
+_qa_cache = OrderedDict()
+_qa_cache_lock = threading.Lock()
+
+# Transcript cleanup patterns, compiled once at import
+_REPEATED_WORD_RE = re.compile(r'\b(\w+)\1+\b')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s.,!?;:()-]')
+_SENTENCE_START_RE = re.compile(r'(^|[.!?]\s+)([a-z])')
+
+_SUGGESTED_QUESTIONS = (
+    "What is the main topic discussed here?",
+    "What are the important details discussed here?"
+)
+
+# Span extraction settings
+_QA_MAX_SEQ_LEN = 512
+_QA_DOC_STRIDE = 128
+_QA_CANDIDATE_POSITIONS = 20  # Most likely start/end tokens paired up per window
+_QA_MAX_BATCH = 16  # Windows per forward pass, bounds peak memory on long transcripts
+_QA_SINGLE_CONTEXT_CHARS = 1800  # Shorter texts fit in one model input (~480 tokens) and aren't chunked
+
+# Quantized kernel backends that run dynamic int8 Linear layers, torch >= 2.0 defaults to 'x86'
+_QUANTIZED_ENGINES = ('x86', 'fbgemm', 'qnnpack', 'onednn')
+
+# Answer quality patterns
+_WORD_RE = re.compile(r'\w+')
+_GENERIC_ANSWER_RE = re.compile(r"i don't know|not sure|unclear|maybe|possibly")
+
+def init_app(app):
+    """Read the Q&A settings from the application config"""
+    global QA_MODEL, QA_CONFIDENCE_THRESHOLD, QA_MAX_ANSWER_LENGTH, QA_CHUNK_SIZE, QA_CHUNK_OVERLAP
+    global QA_QUANTIZE, QA_USE_ONNX, QA_ONNX_MODEL_DIR, QA_NUM_THREADS, QA_TOP_K_CHUNKS, QA_EMBED_MULTI_PROCESS
+    global _chunk_fn
+    
+    QA_MODEL = app.config.get('QA_MODEL', QA_MODEL)
+    QA_CONFIDENCE_THRESHOLD = app.config.get('QA_CONFIDENCE_THRESHOLD', QA_CONFIDENCE_THRESHOLD)
+    QA_MAX_ANSWER_LENGTH = app.config.get('QA_MAX_ANSWER_LENGTH', QA_MAX_ANSWER_LENGTH)
+    QA_CHUNK_SIZE = app.config.get('QA_CHUNK_SIZE', QA_CHUNK_SIZE)
+    QA_CHUNK_OVERLAP = app.config.get('QA_CHUNK_OVERLAP', QA_CHUNK_OVERLAP)
+    QA_QUANTIZE = app.config.get('QA_QUANTIZE', QA_QUANTIZE)
+    QA_USE_ONNX = app.config.get('QA_USE_ONNX', QA_USE_ONNX)
+    QA_ONNX_MODEL_DIR = app.config.get('QA_ONNX_MODEL_DIR', QA_ONNX_MODEL_DIR)
+    QA_NUM_THREADS = app.config.get('QA_NUM_THREADS', QA_NUM_THREADS)
+    QA_TOP_K_CHUNKS = app.config.get('QA_TOP_K_CHUNKS', QA_TOP_K_CHUNKS)
+    QA_EMBED_MULTI_PROCESS = app.config.get('QA_EMBED_MULTI_PROCESS', QA_EMBED_MULTI_PROCESS)
+    
+    _chunk_fn = functools.partial(_chunk_text, max_length=QA_CHUNK_SIZE, overlap=QA_CHUNK_OVERLAP)
 
 def _load_qa_model():
     """Load the DistilBERT Q&A model from Hugging Face"""
-    global _qa_model, _qa_tokenizer, _qa_pipeline
+    global _qa_model, _qa_tokenizer
     
-    if _qa_model is None or _qa_tokenizer is None:
-        try:
-            # Get model name from config (with fallback for testing outside Flask context)
-            model_name = 'distilbert-base-cased-distilled-squad'  # Default
-            
+    if _qa_model is not None and _qa_tokenizer is not None:
+        return _qa_model, _qa_tokenizer
+    
+    # A background warmup and the first question may both get here, only one of them loads
+    with _qa_model_lock:
+        if _qa_model is None or _qa_tokenizer is None:
             try:
-                from flask import current_app
-                model_name = getattr(current_app.config, 'QA_MODEL', model_name)
-                current_app.logger.info(f"Loading Q&A model: {model_name}...")
-            except RuntimeError:
-                # Working outside of application context (e.g., testing)
-                print(f"Loading Q&A model: {model_name}...")
-            
-            _qa_tokenizer = AutoTokenizer.from_pretrained(model_name)
-            _qa_model = AutoModelForQuestionAnswering.from_pretrained(model_name)
-            
-            # Create a pipeline for easier use
-            _qa_pipeline = pipeline(
-                "question-answering",
-                model=_qa_model,
-                tokenizer=_qa_tokenizer,
-                return_all_scores=True,
-                device=-1  # Use CPU
-            )
-            
-            # Set model to evaluation mode
-            _qa_model.eval()
+                model_name = QA_MODEL
+                
+                try:
+                    from flask import current_app
+                    current_app.logger.info(f"Loading Q&A model: {model_name}...")
+                except RuntimeError:
+                    # Working outside of application context (e.g., testing)
+                    print(f"Loading Q&A model: {model_name}...")
+                
+                # Parallelize within each operator; a single request has nothing to run concurrently across ops.
+                # Half the logical cores is usually one per physical core, and leaves room for the web workers
+                torch.set_num_threads(QA_NUM_THREADS or max(1, (os.cpu_count() or 1) // 2))
+                try:
+                    torch.set_num_interop_threads(1)
+                except RuntimeError:
+                    pass  # Can only be set before any inter-op parallel work has run
+                
+                tokenizer = AutoTokenizer.from_pretrained(model_name)
+                model = None
+                
+                if QA_USE_ONNX:
+                    try:
+                        model = _load_onnx_qa_model(model_name, QA_ONNX_MODEL_DIR)
+                    except ImportError as e:
+                        try:
+                            from flask import current_app
+                            current_app.logger.warning(f"ONNX Runtime unavailable, falling back to PyTorch: {str(e)}")
+                        except RuntimeError:
+                            print(f"Warning: ONNX Runtime unavailable, falling back to PyTorch: {str(e)}")
+                
+                if model is None:
+                    model = AutoModelForQuestionAnswering.from_pretrained(model_name)
+                    
+                    # Set model to evaluation mode
+                    model.eval()
+                    
+                    # Dynamic int8 quantization of the Linear layers for faster CPU inference,
+                    # skipped on builds without an int8 kernel backend
+                    if QA_QUANTIZE and torch.backends.quantized.engine in _QUANTIZED_ENGINES:
+                        model = torch.quantization.quantize_dynamic(
+                            model, {torch.nn.Linear}, dtype=torch.qint8
+                        )
+                
+                # Only publish a fully loaded model, so a failed load is retried from scratch
+                _qa_tokenizer = tokenizer
+                _qa_model = model
+                
+                try:
+                    from flask import current_app
+                    current_app.logger.info("Q&A model loaded successfully!")
+                except RuntimeError:
+                    print("Q&A model loaded successfully!")
+                
+            except Exception as e:
+                try:
+                    from flask import current_app
+                    current_app.logger.error(f"Error loading Q&A model: {str(e)}")
+                except RuntimeError:
+                    print(f"Error loading Q&A model: {str(e)}")
+                raise e
+    
+    return _qa_model, _qa_tokenizer
+
+def preload_model():
+    """
+    Load the Q&A model ahead of the first question
+    
+    Called at startup so the first user doesn't wait for the model load, and so
+    servers that fork workers after loading the app (e.g. gunicorn --preload)
+    share the weight pages copy-on-write between workers.
+    """
+    try:
+        _load_qa_model()
+    except Exception:
+        pass  # Already logged, answer_question will retry the load
+
+def _load_onnx_qa_model(model_name, model_dir):
+    """
+    Load the Q&A model as an optimized ONNX Runtime session
+    
+    The model is exported to ONNX on first use and saved under model_dir,
+    so later loads skip the export. Inputs and outputs are IO-bound to the
+    session, so tensors aren't copied through numpy on every call.
+    
+    Args:
+        model_name (str): Hugging Face model name
+        model_dir (str): Directory where exported models are kept
+    
+    Returns:
+        ORTModelForQuestionAnswering: Model usable in place of the PyTorch one
+    """
+    import onnxruntime as ort
+    from optimum.onnxruntime import ORTModelForQuestionAnswering
+    
+    session_options = ort.SessionOptions()
+    session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    
+    export_dir = _onnx_export_dir(model_name, model_dir)
+    if os.path.exists(os.path.join(export_dir, 'model.onnx')):
+        return ORTModelForQuestionAnswering.from_pretrained(
+            export_dir,
+            provider='CPUExecutionProvider',
+            session_options=session_options,
+            use_io_binding=True
+        )
+    
+    model = ORTModelForQuestionAnswering.from_pretrained(
+        model_name,
+        export=True,
+        provider='CPUExecutionProvider',
+        session_options=session_options,
+        use_io_binding=True
+    )
+    os.makedirs(export_dir, exist_ok=True)
+    model.save_pretrained(export_dir)
+    return model
+
+def _onnx_export_dir(model_name, model_dir):
+    """Directory an exported ONNX model is saved to"""
+    return os.path.join(model_dir, model_name.replace('/', '--'))
+
+def export_onnx_model():
+    """
+    Export the configured Q&A model to ONNX ahead of time
+    
+    Lets deployments pay the export once at build time instead of on the
+    first question after QA_USE_ONNX is enabled.
+    
+    Returns:
+        str: Directory holding the exported model
+    """
+    _load_onnx_qa_model(QA_MODEL, QA_ONNX_MODEL_DIR)
+    return _onnx_export_dir(QA_MODEL, QA_ONNX_MODEL_DIR)
+
+def download_models():
+    """
+    Download the Q&A and embedding models into the Hugging Face cache
+    
+    Used by setup so the first question doesn't wait for the download. The
+    Q&A model is only fetched, not quantized or kept loaded.
+    """
+    AutoTokenizer.from_pretrained(QA_MODEL)
+    AutoModelForQuestionAnswering.from_pretrained(QA_MODEL)
+    _load_embedding_model()
+
+def _load_embedding_model():
+    """Load the SentenceTransformer used to embed questions for the answer cache"""
+    global _embedding_model
+    
+    if _embedding_model is not None:
+        return _embedding_model
+    
+    # Concurrent first requests (or a background prepare_context) would otherwise each load a copy
+    with _embedding_model_lock:
+        if _embedding_model is None:
+            from sentence_transformers import SentenceTransformer
+            _embedding_model = SentenceTransformer(_EMBEDDING_MODEL_NAME, device='cpu')
+    
+    return _embedding_model
+
+def _embed_texts(texts, batch_size=32):
+    """
+    Embed questions or chunks for semantic cache lookups and chunk ranking
+    
+    Args:
+        texts (list): Preprocessed questions or transcript chunks
+        batch_size (int): Number of texts encoded per forward pass
+    
+    Returns:
+        numpy.ndarray: L2-normalized float32 embeddings, one row per text, or
+        None if the embedding model is unavailable
+    """
+    global _embedding_unavailable
+    
+    if _embedding_unavailable:
+        return None
+    
+    try:
+        model = _load_embedding_model()
+    except Exception as e:
+        # Answering still works without the cache, so don't retry on every call
+        _embedding_unavailable = True
+        try:
+            from flask import current_app
+            current_app.logger.warning(f"Semantic cache disabled, could not load embedding model: {str(e)}")
+        except RuntimeError:
+            print(f"Warning: Semantic cache disabled, could not load embedding model: {str(e)}")
+        return None
+    
+    # Many chunks are spread over the embedding worker processes, if enabled
+    if len(texts) >= _EMBED_MULTI_PROCESS_MIN_TEXTS:
+        embeddings = _encode_multi_process(model, texts, batch_size)
+        if embeddings is not None:
+            return embeddings
+    
+    try:
+        return model.encode(texts, batch_size=batch_size, convert_to_numpy=True, normalize_embeddings=True)
+    except Exception as e:
+        try:
+            from flask import current_app
+            current_app.logger.warning(f"Could not embed texts: {str(e)}")
+        except RuntimeError:
+            print(f"Warning: Could not embed texts: {str(e)}")
+        return None
+
+def _encode_multi_process(model, texts, batch_size):
+    """
+    Embed texts in the embedding worker processes
+    
+    Returns:
+        numpy.ndarray: L2-normalized embeddings, or None if the pool is
+        disabled or failed, in which case the caller encodes in-process
+    """
+    global _embedding_pool_unavailable
+    
+    pool = _load_embedding_pool(model)
+    if pool is None:
+        return None
+    
+    try:
+        # The pool's input and output queues are shared, so concurrent calls would take each other's results
+        with _embedding_pool_lock:
+            embeddings = model.encode_multi_process(texts, pool, batch_size=batch_size)
+    except Exception as e:
+        _embedding_pool_unavailable = True
+        try:
+            from flask import current_app
+            current_app.logger.warning(f"Embedding worker processes failed, encoding in-process: {str(e)}")
+        except RuntimeError:
+            print(f"Warning: Embedding worker processes failed, encoding in-process: {str(e)}")
+        return None
+    
+    return embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+def _load_embedding_pool(model):
+    """
+    Start the embedding worker processes
+    
+    Each worker runs torch on a single thread, and there are at most
+    _EMBED_MAX_PROCESSES of them, so together they use no more threads
+    than the in-process encode would.
+    
+    Returns:
+        dict: sentence-transformers process pool, or None if it is disabled
+        or couldn't be started, in which case texts are encoded in-process
+    """
+    global _embedding_pool, _embedding_pool_unavailable
+    
+    if _embedding_pool_unavailable:
+        return None
+    if _embedding_pool is not None:
+        return _embedding_pool
+    
+    with _embedding_pool_lock:
+        if _embedding_pool is None and not _embedding_pool_unavailable:
+            processes = min(_EMBED_MAX_PROCESSES, (os.cpu_count() or 1) // 2)
+            if not QA_EMBED_MULTI_PROCESS or processes < 2:
+                _embedding_pool_unavailable = True
+                return None
             
+            # Spawned workers read their torch thread counts from the environment they start with
+            thread_settings = {name: os.environ.get(name) for name in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS')}
+            os.environ.update({name: '1' for name in thread_settings})
             try:
-                from flask import current_app
-                current_app.logger.info("Q&A model loaded successfully!")
-            except RuntimeError:
-                print("Q&A model loaded successfully!")
+                pool = model.start_multi_process_pool(target_devices=['cpu'] * processes)
+            except Exception as e:
+                _embedding_pool_unavailable = True
+                try:
+                    from flask import current_app
+                    current_app.logger.warning(f"Could not start embedding worker processes: {str(e)}")
+                except RuntimeError:
+                    print(f"Warning: Could not start embedding worker processes: {str(e)}")
+                return None
+            finally:
+                for name, value in thread_settings.items():
+                    if value is None:
+                        os.environ.pop(name, None)
+                    else:
+                        os.environ[name] = value
             
-        except Exception as e:
-            try:
-                from flask import current_app
-                current_app.logger.error(f"Error loading Q&A model: {str(e)}")
-            except RuntimeError:
-                print(f"Error loading Q&A model: {str(e)}")
-            raise e
+            atexit.register(model.stop_multi_process_pool, pool)
+            _embedding_pool = pool
     
-    return _qa_model, _qa_tokenizer, _qa_pipeline
+    return _embedding_pool
+
+def _lookup_cached_answer(transcript_key, embedding):
+    """
+    Find the cached answer whose question is closest to the given embedding
+    
+    Returns:
+        tuple: (similarity, result) for the best match, or (0.0, None)
+    """
+    with _qa_cache_lock:
+        entries = _qa_cache.get(transcript_key)
+        if not entries:
+            return 0.0, None
+        _qa_cache.move_to_end(transcript_key)
+        embeddings = np.stack([entry[0] for entry in entries])
+        results = [entry[2] for entry in entries]
+    
+    similarities = np.dot(embeddings, embedding)
+    best = int(np.argmax(similarities))
+    return float(similarities[best]), results[best]
+
+def _cache_answer(transcript_key, embedding, question, result):
+    """Store an answer in the semantic cache, evicting the oldest entries when full"""
+    with _qa_cache_lock:
+        entries = _qa_cache.setdefault(transcript_key, [])
+        _qa_cache.move_to_end(transcript_key)
+        entries.append((embedding, question, dict(result)))
+        if len(entries) > _QA_CACHE_MAX_ENTRIES:
+            del entries[0]
+        while len(_qa_cache) > _QA_CACHE_MAXSIZE:
+            _qa_cache.popitem(last=False)
+
+def _combine_cached_answers(transcript_key, question):
+    """
+    Answer a compound question by combining cached answers to its parts
+    
+    Args:
+        transcript_key (str): sha1 of the transcript the question is about
+        question (str): Preprocessed question, e.g. "What is X and how does Y work?"
+    
+    Returns:
+        dict: Combined result, or None if any part has no close enough cached answer
+    """
+    sub_questions = [preprocess_question(part) for part in _COMPOUND_SPLIT_RE.split(question.rstrip('?'))]
+    sub_questions = [sub_question for sub_question in sub_questions if len(sub_question) > 3]
+    if len(sub_questions) < 2:
+        return None
+    
+    # Nothing to combine yet (e.g. the first question about a transcript), skip embedding the parts
+    with _qa_cache_lock:
+        if not _qa_cache.get(transcript_key):
+            return None
+    
+    embeddings = _embed_texts(sub_questions)
+    if embeddings is None:
+        return None
+    
+    total_similarity = 0.0
+    results = []
+    for sub_question, embedding in zip(sub_questions, embeddings):
+        similarity, result = _lookup_cached_answer(transcript_key, embedding)
+        if result is None or similarity <= _QA_COMBINE_SINGLE_SIMILARITY:
+            return None
+        total_similarity += similarity
+        results.append((sub_question, result))
+    
+    if total_similarity <= _QA_COMBINE_TOTAL_SIMILARITY:
+        return None
+    
+    return {
+        'answer': ' '.join(post_process_answer(result['answer'], sub_question) for sub_question, result in results),
+        'confidence': sum(result['confidence'] for _, result in results) / len(results),
+        'source_text': ' ... '.join(result['source_text'] for _, result in results if result['source_text'])
+    }
 
 def preprocess_text(text):
     """Enhanced text preprocessing for better Q&A performance"""
     if not text:
         return ""
     
-    # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text.strip())
+    # Remove extra whitespace and normalize, str.split runs in C and also strips the ends
+    text = ' '.join(text.split())
     
     # Fix common transcription issues
-    text = re.sub(r'\b(\w+)\1+\b', r'\1', text)  # Remove repeated words
-    text = re.sub(r'[^\w\s.,!?;:()-]', '', text)  # Remove special chars
+    text = _REPEATED_WORD_RE.sub(r'\1', text)  # Remove repeated words
+    text = _SPECIAL_CHARS_RE.sub('', text)  # Remove special chars
     
     # Capitalize sentences properly
-    sentences = text.split('.')
-    processed_sentences = []
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if sentence:
-            sentence = sentence[0].upper() + sentence[1:] if len(sentence) > 1 else sentence.upper()
-            processed_sentences.append(sentence)
-    
-    return '. '.join(processed_sentences)
+    return _SENTENCE_START_RE.sub(lambda match: match.group(1) + match.group(2).upper(), text)
+
+@functools.lru_cache(maxsize=256)
+def _preprocessed_transcript(transcript):
+    """Cached preprocess_text, since the same transcript is asked about repeatedly"""
+    return preprocess_text(transcript)
 
 def preprocess_question(question):
     """Enhanced question preprocessing"""
@@ -100,57 +502,214 @@ def preprocess_question(question):
 
 def smart_chunking(text, question, max_length=None, overlap=None):
     """Intelligent chunking that considers question context"""
-    # Use config values if not provided, with fallbacks for outside Flask context
-    if max_length is None:
-        try:
-            from flask import current_app
-            max_length = getattr(current_app.config, 'QA_CHUNK_SIZE', 350)
-        except RuntimeError:
-            max_length = 350
+    # A short transcript with the configured settings is read in a single forward pass, with nothing
+    # to split or rank. Preprocessed text has one space between words, so this never drops a split
+    # QA_CHUNK_SIZE would have made
+    if (max_length is None and overlap is None and len(text) < _QA_SINGLE_CONTEXT_CHARS
+            and text.count(' ') < QA_CHUNK_SIZE):
+        return [text]
+    
+    if max_length is None and overlap is None:
+        chunks = list(_chunk_fn(text))
+    else:
+        if max_length is None:
+            max_length = QA_CHUNK_SIZE
+        
+        if overlap is None:
+            overlap = QA_CHUNK_OVERLAP
+        
+        chunks = list(_chunk_text(text, max_length, overlap))
+    
+    # Only the chunks closest to the question are worth running through the model
+    if question and 0 < QA_TOP_K_CHUNKS < len(chunks):
+        embeddings = _embed_texts([question])
+        chunks = _top_chunks(chunks, embeddings[0] if embeddings is not None else None)
     
-    if overlap is None:
+    return chunks
+
+@functools.lru_cache(maxsize=32)
+def _chunk_embeddings(chunks):
+    """Embed a tuple of chunks once, every question about them reuses the matrix"""
+    embeddings = _embed_texts(list(chunks), batch_size=64)
+    if embeddings is None:
+        return None
+    return np.ascontiguousarray(embeddings, dtype=np.float32)
+
+def _top_chunks(chunks, question_embedding, embeddings=None):
+    """
+    Keep the QA_TOP_K_CHUNKS chunks most similar to the question
+    
+    Args:
+        chunks (list): Transcript chunks
+        question_embedding (numpy.ndarray): L2-normalized question embedding
+        embeddings (numpy.ndarray): Chunk embeddings if already computed
+    
+    Returns:
+        list: The best chunks in reading order, or every chunk if they can't be ranked
+    """
+    k = QA_TOP_K_CHUNKS
+    if not 0 < k < len(chunks):
+        return list(chunks)
+    
+    if embeddings is None and question_embedding is not None:
+        embeddings = _chunk_embeddings(tuple(chunks))
+    if question_embedding is None or embeddings is None:
         try:
             from flask import current_app
-            overlap = getattr(current_app.config, 'QA_CHUNK_OVERLAP', 75)
+            current_app.logger.warning(f"Embeddings unavailable, reading all {len(chunks)} chunks instead of the top {k}")
         except RuntimeError:
-            overlap = 75
+            print(f"Warning: Embeddings unavailable, reading all {len(chunks)} chunks instead of the top {k}")
+        return list(chunks)
+    
+    # Embeddings are normalized, so one matrix-vector product gives every cosine similarity
+    scores = embeddings @ question_embedding.astype(np.float32, copy=False)
+    top = np.sort(np.argpartition(-scores, k)[:k])
+    return [chunks[j] for j in top]
+
+@functools.lru_cache(maxsize=512)
+def _chunk_text(text, max_length, overlap):
+    """
+    Split text into overlapping chunks, preferring sentence boundaries
     
+    Chunks only depend on the text and chunk settings, so they are cached
+    and reused for every question about the same transcript.
+    
+    Returns:
+        tuple: Chunk strings
+    """
     words = text.split()
     
     if len(words) <= max_length:
-        return [text]
+        return (text,)
+    
+    word_count = len(words)
     
-    # Extract keywords from question for better chunking
-    question_words = set(question.lower().split()) - set(['what', 'when', 'where', 'who', 'why', 'how', 'is', 'are', 'was', 'were', 'the', 'a', 'an'])
+    # Indices of words that end a sentence, searched instead of re-joining and rfind-ing every chunk
+    sentence_ends = np.flatnonzero(np.fromiter(
+        (word.endswith(('.', '!', '?')) for word in words), dtype=bool, count=word_count
+    ))
+    # offsets[i] is the character position of word i in ' '.join(words)
+    offsets = np.zeros(word_count + 1, dtype=np.int64)
+    np.cumsum(np.fromiter((len(word) + 1 for word in words), dtype=np.int64, count=word_count), out=offsets[1:])
     
     chunks = []
     start = 0
     
-    while start < len(words):
-        end = min(start + max_length, len(words))
-        chunk_words = words[start:end]
+    while start < word_count:
+        end = min(start + max_length, word_count)
         
         # Try to end chunk at sentence boundary
-        chunk_text = ' '.join(chunk_words)
-        if end < len(words):  # Not the last chunk
-            last_period = chunk_text.rfind('.')
-            last_exclamation = chunk_text.rfind('!')
-            last_question = chunk_text.rfind('?')
-            
-            sentence_end = max(last_period, last_exclamation, last_question)
-            if sentence_end > len(chunk_text) * 0.7:  # If sentence boundary is in last 30%
-                chunk_text = chunk_text[:sentence_end + 1]
-                # Recalculate end position
-                end = start + len(chunk_text.split())
+        if end < word_count:  # Not the last chunk
+            last_end = np.searchsorted(sentence_ends, end) - 1
+            if last_end >= 0 and sentence_ends[last_end] >= start:
+                boundary_word = sentence_ends[last_end]
+                chunk_length = offsets[end] - offsets[start] - 1
+                sentence_end = offsets[boundary_word + 1] - offsets[start] - 2
+                if sentence_end > chunk_length * 0.7:  # If sentence boundary is in last 30%
+                    end = int(boundary_word) + 1
         
-        chunks.append(chunk_text)
+        chunks.append(' '.join(words[start:end]))
         
-        if end >= len(words):
+        if end >= word_count:
             break
         
-        start = end - overlap
+        start = max(end - overlap, start + 1)
     
-    return chunks
+    return tuple(chunks)
+
+# Chunker with the configured chunk size and overlap bound in, rebuilt by init_app()
+_chunk_fn = functools.partial(_chunk_text, max_length=QA_CHUNK_SIZE, overlap=QA_CHUNK_OVERLAP)
+
+def _softmax(logits, mask):
+    """Softmax over the positions where mask is True, zero elsewhere"""
+    logits = np.where(mask, logits, -np.inf)
+    exp = np.exp(logits - logits.max())
+    return exp / exp.sum()
+
+def _top_indices(scores, k):
+    """Indices of the k highest scores in no particular order, without sorting every score"""
+    if k >= len(scores):
+        return np.arange(len(scores))
+    return np.argpartition(-scores, k)[:k]
+
+def _run_qa(model, tokenizer, questions, contexts, top_k=3, max_answer_len=200):
+    """
+    Extract the best answer spans for (question, context) pairs
+    
+    All pairs are tokenized together and scored in forward passes of up to
+    _QA_MAX_BATCH windows. Contexts longer than the model input are split
+    into overlapping windows.
+    
+    Args:
+        model: Q&A model returning start and end logits
+        tokenizer: Fast tokenizer matching the model
+        questions (list): Questions, one per context
+        contexts (list): Texts to extract answers from
+        top_k (int): Number of answers to return per pair
+        max_answer_len (int): Maximum answer length in tokens
+    
+    Returns:
+        list: For each pair, up to top_k dicts with 'answer', 'score', and the
+        'start'/'end' character offsets of the answer in its context, best first
+    """
+    encodings = tokenizer(
+        questions,
+        contexts,
+        padding=True,
+        truncation='only_second',
+        max_length=_QA_MAX_SEQ_LEN,
+        stride=_QA_DOC_STRIDE,
+        return_overflowing_tokens=True,
+        return_offsets_mapping=True,
+        return_tensors='pt'
+    )
+    offset_mapping = encodings.pop('offset_mapping').tolist()
+    sample_mapping = encodings.pop('overflow_to_sample_mapping').tolist()
+    
+    inputs = {name: encodings[name] for name in tokenizer.model_input_names if name in encodings}
+    start_batches = []
+    end_batches = []
+    with torch.inference_mode():
+        for batch_start in range(0, len(sample_mapping), _QA_MAX_BATCH):
+            batch_end = batch_start + _QA_MAX_BATCH
+            outputs = model(**{name: tensor[batch_start:batch_end] for name, tensor in inputs.items()})
+            start_batches.append(outputs.start_logits.numpy())
+            end_batches.append(outputs.end_logits.numpy())
+    start_logits = np.concatenate(start_batches)
+    end_logits = np.concatenate(end_batches)
+    
+    spans = [{} for _ in contexts]
+    for feature_index, sample_index in enumerate(sample_mapping):
+        context_mask = np.array([sequence_id == 1 for sequence_id in encodings.sequence_ids(feature_index)])
+        # Normalize over the context and [CLS] like the transformers pipeline, so
+        # scores stay comparable with QA_CONFIDENCE_THRESHOLD
+        score_mask = context_mask.copy()
+        score_mask[0] = True
+        start_scores = _softmax(start_logits[feature_index], score_mask)
+        end_scores = _softmax(end_logits[feature_index], score_mask)
+        
+        starts = [index for index in _top_indices(start_scores, _QA_CANDIDATE_POSITIONS) if context_mask[index]]
+        ends = [index for index in _top_indices(end_scores, _QA_CANDIDATE_POSITIONS) if context_mask[index]]
+        offsets = offset_mapping[feature_index]
+        
+        for start in starts:
+            for end in ends:
+                if end < start or end - start + 1 > max_answer_len:
+                    continue
+                span = (offsets[start][0], offsets[end][1])
+                score = float(start_scores[start] * end_scores[end])
+                # Overlapping windows can find the same span; keep its best score
+                if score > spans[sample_index].get(span, 0.0):
+                    spans[sample_index][span] = score
+    
+    results = []
+    for context, context_spans in zip(contexts, spans):
+        best_spans = sorted(context_spans.items(), key=lambda item: item[1], reverse=True)[:top_k]
+        results.append([
+            {'answer': context[start:end], 'score': score, 'start': start, 'end': end}
+            for (start, end), score in best_spans
+        ])
+    return results
 
 def calculate_answer_quality(answer, question, context):
     """Calculate answer quality based on multiple factors"""
@@ -163,16 +722,17 @@ def calculate_answer_quality(answer, question, context):
     if len(answer) < 10:
         score -= 0.2
     
+    answer_lower = answer.lower()
+    
     # Bonus for answers that contain question keywords
-    question_words = set(re.findall(r'\w+', question.lower()))
-    answer_words = set(re.findall(r'\w+', answer.lower()))
+    question_words = set(_WORD_RE.findall(question.lower()))
+    answer_words = set(_WORD_RE.findall(answer_lower))
     keyword_overlap = len(question_words.intersection(answer_words))
     if keyword_overlap > 0:
         score += 0.1 * keyword_overlap
     
     # Penalty for generic answers
-    generic_phrases = ['i don\'t know', 'not sure', 'unclear', 'maybe', 'possibly']
-    if any(phrase in answer.lower() for phrase in generic_phrases):
+    if _GENERIC_ANSWER_RE.search(answer_lower):
         score -= 0.3
     
     # Bonus for complete sentences
@@ -181,6 +741,106 @@ def calculate_answer_quality(answer, question, context):
     
     return max(0.0, min(1.0, score))
 
+def _cached_result(transcript_key, question, embedding):
+    """
+    Answer a question from the semantic cache if possible
+    
+    Returns:
+        dict: Cached (or combined cached) result, or None on a cache miss
+    """
+    similarity, cached_result = _lookup_cached_answer(transcript_key, embedding)
+    if cached_result is not None and similarity > _QA_CACHE_SIMILARITY:
+        try:
+            from flask import current_app
+            current_app.logger.info(f"Semantic cache hit (similarity {similarity:.3f}) for: {question}")
+        except RuntimeError:
+            print(f"Semantic cache hit (similarity {similarity:.3f}) for: {question}")
+        return dict(cached_result)
+    
+    # Compound questions may be answerable from cached answers to their parts
+    combined_result = _combine_cached_answers(transcript_key, question)
+    if combined_result is not None:
+        try:
+            from flask import current_app
+            current_app.logger.info(f"Combined cached answers for compound question: {question}")
+        except RuntimeError:
+            print(f"Combined cached answers for compound question: {question}")
+        _cache_answer(transcript_key, embedding, question, combined_result)
+        return combined_result
+    
+    return None
+
+def _select_answer(question, candidates):
+    """
+    Pick the best answer for a question from the model's candidate spans
+    
+    Args:
+        question (str): Preprocessed question
+        candidates (list): (chunk_index, chunk, result) tuples from _run_qa
+    
+    Returns:
+        dict: Contains answer, confidence score, and metadata
+    """
+    all_answers = []
+    
+    for i, chunk, result in candidates:
+        answer = result['answer'].strip()
+        confidence = result['score']
+        
+        if len(answer) >= 3:  # Minimum answer length
+            # Calculate additional quality score
+            quality_bonus = calculate_answer_quality(answer, question, chunk)
+            adjusted_confidence = confidence + quality_bonus
+            
+            all_answers.append({
+                'answer': answer,
+                'confidence': adjusted_confidence,
+                'original_confidence': confidence,
+                'source_chunk': chunk,
+                'chunk_index': i,
+                'start': result['start'],  # Character offsets of the answer in the chunk
+                'end': result['end']
+            })
+    
+    if not all_answers:
+        return {
+            'answer': "I couldn't find an answer to your question in the transcript. Try asking about specific topics mentioned in the conversation.",
+            'confidence': 0.0,
+            'source_text': ""
+        }
+    
+    # Sort answers by adjusted confidence
+    all_answers.sort(key=lambda x: x['confidence'], reverse=True)
+    best_answer = all_answers[0]
+    
+    # Additional validation using config threshold
+    if best_answer['original_confidence'] < QA_CONFIDENCE_THRESHOLD:
+        return {
+            'answer': "I found some potential answers but I'm not confident about them. Could you try rephrasing your question more specifically?",
+            'confidence': 0.0,
+            'source_text': ""
+        }
+    
+    # Post-process the answer
+    final_answer = post_process_answer(best_answer['answer'], question)
+    
+    # Prepare source text around the span the model picked
+    source_start = max(0, best_answer['start'] - 50)
+    source_end = min(len(best_answer['source_chunk']), best_answer['end'] + 50)
+    source_text = best_answer['source_chunk'][source_start:source_end]
+    
+    try:
+        from flask import current_app
+        current_app.logger.info(f"Best answer found with confidence: {best_answer['original_confidence']:.3f}")
+    except RuntimeError:
+        print(f"Best answer found with confidence: {best_answer['original_confidence']:.3f}")
+    
+    return {
+        'answer': final_answer,
+        'confidence': min(best_answer['original_confidence'], 0.95),  # Cap confidence at 95%
+        'source_text': source_text.strip()
+    }
+
 def answer_question(transcript, question, max_answer_length=None):
     """
     Enhanced Q&A function with better answer selection and confidence scoring
@@ -193,131 +853,177 @@ def answer_question(transcript, question, max_answer_length=None):
     Returns:
         dict: Contains answer, confidence score, and metadata
     """
+    return answer_questions(transcript, [question], max_answer_length)[0]
+
+def answer_questions(transcript, questions, max_answer_length=None):
+    """
+    Answer several questions about the same transcript
+    
+    Questions that miss the semantic cache are run through the model
+    together, as one batch of (question, chunk) pairs.
+    
+    Args:
+        transcript (str): The text to search for answers
+        questions (list): The questions to answer
+        max_answer_length (int): Maximum length of the answers
+    
+    Returns:
+        list: One dict per question, in order, each containing answer,
+        confidence score, and metadata
+    """
+    transcript_key = hashlib.sha1((transcript or '').encode('utf-8')).hexdigest()
+    return _answer_questions(transcript_key, questions, max_answer_length, transcript=transcript)
+
+# A transcript prepared once for many questions: semantic cache key, chunks and their embeddings
+ContextHandle = namedtuple('ContextHandle', ['key', 'chunks', 'embeddings'])
+
+def prepare_context(transcript):
+    """
+    Preprocess, chunk and embed a transcript once for many questions
+    
+    Args:
+        transcript (str): The text to search for answers
+    
+    Returns:
+        ContextHandle: Pass to answer_prepared for every question about the transcript
+    """
+    key = hashlib.sha1((transcript or '').encode('utf-8')).hexdigest()
+    chunks = tuple(chunk for chunk in smart_chunking(_preprocessed_transcript(transcript or ''), None) if chunk)
+    
+    # Embeddings are only used to rank chunks, which needs more than QA_TOP_K_CHUNKS of them
+    embeddings = _chunk_embeddings(chunks) if 0 < QA_TOP_K_CHUNKS < len(chunks) else None
+    
+    return ContextHandle(key, chunks, embeddings)
+
+def answer_prepared(handle, question, max_answer_length=None):
+    """
+    Answer a question about a transcript prepared with prepare_context
+    
+    Only the question is embedded, the chunks are ranked against the
+    embeddings stored in the handle.
+    
+    Args:
+        handle (ContextHandle): The prepared transcript
+        question (str): The question to answer
+        max_answer_length (int): Maximum length of the answer
+    
+    Returns:
+        dict: Contains answer, confidence score, and metadata
+    """
+    return _answer_questions(handle.key, [question], max_answer_length, context=handle)[0]
+
+def _answer_questions(transcript_key, questions, max_answer_length, transcript=None, context=None):
+    """
+    Answer questions about either a raw transcript or a prepared context
+    
+    Args:
+        transcript_key (str): Semantic cache key for the transcript
+        questions (list): The questions to answer
+        max_answer_length (int): Maximum length of the answers
+        transcript (str): Raw transcript, preprocessed and chunked on a cache miss
+        context (ContextHandle): Prepared chunks and embeddings, used instead of the transcript
+    
+    Returns:
+        list: One result dict per question, in order
+    """
     try:
-        # Get config values with fallbacks for outside Flask context
         if max_answer_length is None:
-            try:
-                from flask import current_app
-                max_answer_length = getattr(current_app.config, 'QA_MAX_ANSWER_LENGTH', 200)
-            except RuntimeError:
-                max_answer_length = 200
+            max_answer_length = QA_MAX_ANSWER_LENGTH
         
-        try:
-            from flask import current_app
-            confidence_threshold = getattr(current_app.config, 'QA_CONFIDENCE_THRESHOLD', 0.05)
-        except RuntimeError:
-            confidence_threshold = 0.05
+        questions = [preprocess_question(question) for question in questions]
+        results = [None] * len(questions)
+        question_embeddings = [None] * len(questions)
         
-        # Load the model and pipeline
-        model, tokenizer, pipeline = _load_qa_model()
+        # Return cached answers for questions that were already asked
+        asked = [i for i, question in enumerate(questions) if question]
+        if asked:
+            embeddings = _embed_texts([questions[i] for i in asked])
+            if embeddings is not None:
+                for i, embedding in zip(asked, embeddings):
+                    question_embeddings[i] = embedding
+                    results[i] = _cached_result(transcript_key, questions[i], embedding)
         
-        # Preprocess inputs
-        transcript = preprocess_text(transcript)
-        question = preprocess_question(question)
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
         
-        if not transcript or not question:
-            return {
-                'answer': "I couldn't process your question. Please make sure both the transcript and question are valid.",
-                'confidence': 0.0,
-                'source_text': ""
-            }
+        # Load the model and tokenizer
+        model, tokenizer = _load_qa_model()
         
-        # Log processing info (with context safety)
-        try:
-            from flask import current_app
-            current_app.logger.info(f"Processing question: {question}")
-        except RuntimeError:
-            print(f"Processing question: {question}")
+        # Preprocess inputs
+        if context is None:
+            transcript = _preprocessed_transcript(transcript)
         
-        # Use smart chunking for better context
-        chunks = smart_chunking(transcript, question)
+        for i in pending:
+            if not (context.chunks if context else transcript) or not questions[i]:
+                results[i] = {
+                    'answer': "I couldn't process your question. Please make sure both the transcript and question are valid.",
+                    'confidence': 0.0,
+                    'source_text': ""
+                }
+        pending = [i for i in pending if results[i] is None]
         
-        try:
-            from flask import current_app
-            current_app.logger.info(f"Created {len(chunks)} chunks for processing")
-        except RuntimeError:
-            print(f"Created {len(chunks)} chunks for processing")
+        # Pair every pending question with each of its chunks
+        pair_questions = []
+        pair_chunks = []
+        pair_owners = []
+        for i in pending:
+            question = questions[i]
+            
+            # Log processing info (with context safety)
+            try:
+                from flask import current_app
+                current_app.logger.info(f"Processing question: {question}")
+            except RuntimeError:
+                print(f"Processing question: {question}")
+            
+            # Use smart chunking for better context, ranked with the embedding computed above
+            if context is None:
+                question_chunks = _top_chunks(smart_chunking(transcript, None), question_embeddings[i])
+            else:
+                question_chunks = _top_chunks(context.chunks, question_embeddings[i], context.embeddings)
+            
+            try:
+                from flask import current_app
+                current_app.logger.info(f"Created {len(question_chunks)} chunks for processing")
+            except RuntimeError:
+                print(f"Created {len(question_chunks)} chunks for processing")
+            
+            for chunk_index, chunk in enumerate(question_chunks):
+                pair_questions.append(question)
+                pair_chunks.append(chunk)
+                pair_owners.append((i, chunk_index))
         
-        all_answers = []
+        candidates = {i: [] for i in pending}
         
-        for i, chunk in enumerate(chunks):
+        if pair_questions:
             try:
-                # Use the pipeline for better results
-                results = pipeline(
-                    question=question,
-                    context=chunk,
-                    max_answer_len=max_answer_length,
-                    top_k=3,  # Get top 3 answers
-                    doc_stride=128,
-                    max_question_len=64,
-                    max_seq_len=512
+                # Run every (question, chunk) pair through the model as a single batch
+                batch_results = _run_qa(
+                    model,
+                    tokenizer,
+                    pair_questions,
+                    pair_chunks,
+                    top_k=3,  # Get top 3 answers per chunk
+                    max_answer_len=max_answer_length
                 )
-                
-                # Process results from pipeline
-                for result in results:
-                    answer = result['answer'].strip()
-                    confidence = result['score']
-                    
-                    if len(answer) >= 3:  # Minimum answer length
-                        # Calculate additional quality score
-                        quality_bonus = calculate_answer_quality(answer, question, chunk)
-                        adjusted_confidence = confidence + quality_bonus
-                        
-                        all_answers.append({
-                            'answer': answer,
-                            'confidence': adjusted_confidence,
-                            'original_confidence': confidence,
-                            'source_chunk': chunk,
-                            'chunk_index': i
-                        })
-                
             except Exception as e:
                 try:
                     from flask import current_app
-                    current_app.logger.warning(f"Error processing chunk {i}: {str(e)}")
+                    current_app.logger.warning(f"Error processing chunks: {str(e)}")
                 except RuntimeError:
-                    print(f"Warning: Error processing chunk {i}: {str(e)}")
-                continue
-        
-        if not all_answers:
-            return {
-                'answer': "I couldn't find an answer to your question in the transcript. Try asking about specific topics mentioned in the conversation.",
-                'confidence': 0.0,
-                'source_text': ""
-            }
-        
-        # Sort answers by adjusted confidence
-        all_answers.sort(key=lambda x: x['confidence'], reverse=True)
-        best_answer = all_answers[0]
-        
-        # Additional validation using config threshold
-        if best_answer['original_confidence'] < confidence_threshold:
-            return {
-                'answer': "I found some potential answers but I'm not confident about them. Could you try rephrasing your question more specifically?",
-                'confidence': 0.0,
-                'source_text': ""
-            }
-        
-        # Post-process the answer
-        final_answer = post_process_answer(best_answer['answer'], question)
+                    print(f"Warning: Error processing chunks: {str(e)}")
+                batch_results = []
+            
+            for (i, chunk_index), chunk, chunk_results in zip(pair_owners, pair_chunks, batch_results):
+                candidates[i].extend((chunk_index, chunk, result) for result in chunk_results)
         
-        # Prepare source text
-        source_start = max(0, best_answer['source_chunk'].find(final_answer) - 50)
-        source_end = min(len(best_answer['source_chunk']), 
-                        best_answer['source_chunk'].find(final_answer) + len(final_answer) + 50)
-        source_text = best_answer['source_chunk'][source_start:source_end]
+        for i in pending:
+            results[i] = _select_answer(questions[i], candidates[i])
+            if question_embeddings[i] is not None and results[i]['confidence'] > 0:
+                _cache_answer(transcript_key, question_embeddings[i], questions[i], results[i])
         
-        try:
-            from flask import current_app
-            current_app.logger.info(f"Best answer found with confidence: {best_answer['original_confidence']:.3f}")
-        except RuntimeError:
-            print(f"Best answer found with confidence: {best_answer['original_confidence']:.3f}")
-        
-        return {
-            'answer': final_answer,
-            'confidence': min(best_answer['original_confidence'], 0.95),  # Cap confidence at 95%
-            'source_text': source_text.strip()
-        }
+        return results
         
     except Exception as e:
         try:
@@ -325,11 +1031,11 @@ def answer_question(transcript, question, max_answer_length=None):
             current_app.logger.error(f"Error in Q&A processing: {str(e)}")
         except RuntimeError:
             print(f"Error in Q&A processing: {str(e)}")
-        return {
+        return [{
             'answer': f"Sorry, I encountered an error while processing your question. Please try again.",
             'confidence': 0.0,
             'source_text': ""
-        }
+        } for _ in questions]
 
 def post_process_answer(answer, question):
     """Post-process the answer for better readability"""
@@ -360,25 +1066,10 @@ def generate_suggested_questions(transcript, max_questions=5):
         max_questions (int): Maximum number of questions to generate
     
     Returns:
-        list: List of suggested questions
+        tuple: Suggested questions
     """
-    try:
-        # Always return these two specific questions
-        return [
-            "What is the main topic discussed here?",
-            "What are the important details discussed here?"
-        ]
-        
-    except Exception as e:
-        try:
-            from flask import current_app
-            current_app.logger.error(f"Error generating suggested questions: {str(e)}")
-        except RuntimeError:
-            print(f"Error generating suggested questions: {str(e)}")
-        return [
-            "What is the main topic discussed here?",
-            "What are the important details discussed here?"
-        ]
+    # The same questions work for any transcript
+    return _SUGGESTED_QUESTIONS
 
 
 class QAService:
@@ -405,6 +1096,46 @@ class QAService:
         """
         return answer_question(transcript, question, max_answer_length)
     
+    def answer_questions_batch(self, questions, transcript, max_answer_length=None):
+        """
+        Answer several questions about the same transcript in one batch
+        
+        Args:
+            questions (list): The questions to answer
+            transcript (str): The transcript text to search for answers
+            max_answer_length (int): Maximum length of the answers
+            
+        Returns:
+            list: One result dictionary per question, in order
+        """
+        return answer_questions(transcript, questions, max_answer_length)
+    
+    def prepare_context(self, transcript):
+        """
+        Preprocess, chunk and embed a transcript once for many questions
+        
+        Args:
+            transcript (str): The transcript text to search for answers
+            
+        Returns:
+            ContextHandle: Prepared transcript for answer_prepared
+        """
+        return prepare_context(transcript)
+    
+    def answer_prepared(self, handle, question, max_answer_length=None):
+        """
+        Answer a question about a prepared transcript
+        
+        Args:
+            handle (ContextHandle): Result of prepare_context
+            question (str): The question to answer
+            max_answer_length (int): Maximum length of the answer
+            
+        Returns:
+            dict: Dictionary containing answer, confidence, and other metadata
+        """
+        return answer_prepared(handle, question, max_answer_length)
+    
     def generate_suggested_questions(self, transcript, max_questions=5):
         """
         Generate suggested questions based on transcript content
@@ -414,7 +1145,7 @@ class QAService:
             max_questions (int): Maximum number of questions to generate
             
         Returns:
-            list: List of suggested questions
+            tuple: Suggested questions
         """
         return generate_suggested_questions(transcript, max_questions)
     
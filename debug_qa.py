@@ -4,6 +4,9 @@ Debugging script to diagnose Q&A performance issues
 """
 import sys
 import os
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -11,14 +14,41 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 def initialize_flask_context():
     """Initialize Flask application context for testing"""
     try:
-        from app import create_app
-        app = create_app()
-        return app.app_context()
+        from app._singleton import get_app
+        return get_app().app_context()
     except Exception as e:
         print(f"Warning: Could not initialize Flask context: {e}")
         print("Running in standalone mode...")
         return None
 
+def read_transcript():
+    """
+    Read a pasted transcript line by line until an empty line
+    
+    Lines are written straight into one buffer rather than kept in a list
+    and joined, so a large paste isn't held in memory twice. A piped
+    transcript (cat transcript.txt | python debug_qa.py) is read whole.
+    
+    Returns:
+        str: The transcript, empty if nothing was pasted
+    """
+    if not sys.stdin.isatty():
+        # Everything up to EOF in one read, blank lines included
+        return sys.stdin.read()
+    
+    buffer = io.StringIO()
+    for line in iter(input, ''):
+        buffer.write(line)
+        buffer.write('\n')
+    return buffer.getvalue()
+
+def read_line(prompt=''):
+    """Like input(), but returns an empty line once piped input is used up"""
+    try:
+        return input(prompt)
+    except EOFError:
+        return ''
+
 def debug_qa_performance():
     """Debug Q&A performance with detailed analysis"""
     
@@ -35,13 +65,13 @@ def debug_qa_performance():
         print("=" * 50)
         
         # Get user input
-        print("\nPlease paste your transcript:")
-        transcript = input().strip()
-        if not transcript:
+        print("\nPlease paste your transcript (press Enter twice when done):")
+        transcript = read_transcript()
+        if not transcript or transcript.isspace():
             transcript = "Sample transcript for testing. John said hello to Mary at 3 PM yesterday in the office."
         
         print("\nPlease enter your question:")
-        question = input().strip()
+        question = read_line().strip()
         if not question:
             question = "Who said hello?"
         
@@ -55,12 +85,16 @@ def debug_qa_performance():
         print(f"Processed transcript length: {len(processed_transcript)} characters")
         print(f"Sample: {processed_transcript[:200]}{'...' if len(processed_transcript) > 200 else ''}")
         
-        # Test chunking
-        chunks = smart_chunking(processed_transcript, question)
+        # Test chunking, then the ranking of those chunks against the question
+        chunks = smart_chunking(processed_transcript, None)
+        ranked_chunks = smart_chunking(processed_transcript, question)
         print(f"\nChunking analysis:")
         print(f"Number of chunks: {len(chunks)}")
         for i, chunk in enumerate(chunks[:3]):  # Show first 3 chunks
             print(f"Chunk {i+1}: {chunk[:100]}{'...' if len(chunk) > 100 else ''}")
+        print(f"Chunks sent to the model: {len(ranked_chunks)}")
+        for i, chunk in enumerate(ranked_chunks[:3]):
+            print(f"Ranked chunk {i+1}: {chunk[:100]}{'...' if len(chunk) > 100 else ''}")
         
         # Test Q&A
         print(f"\n🤖 Running Q&A...")
@@ -113,22 +147,18 @@ def interactive_qa_session():
         if app_context:
             app_context.push()
         
-        from app.services.qa_service import answer_question, generate_suggested_questions
+        from app.services.qa_service import QAService, preload_model
+        
+        # Load the model while the user is pasting the transcript
+        threading.Thread(target=preload_model, daemon=True).start()
         
         print("🎯 Interactive Q&A Testing Session")
         print("=" * 40)
         
         # Get transcript
         print("Please paste your transcript (press Enter twice when done):")
-        lines = []
-        while True:
-            line = input()
-            if line == "":
-                break
-            lines.append(line)
-        
-        transcript = "\n".join(lines)
-        if not transcript.strip():
+        transcript = read_transcript()
+        if not transcript or transcript.isspace():
             print("No transcript provided. Using sample...")
             transcript = """
             Welcome to our team meeting. We discussed the project timeline today.
@@ -140,8 +170,14 @@ def interactive_qa_session():
         
         print(f"\n📄 Transcript loaded ({len(transcript)} characters)")
         
+        # Preprocess, chunk and embed once in the background, every question reuses the result
+        qa = QAService()
+        executor = ThreadPoolExecutor(max_workers=1)
+        pending_handle = executor.submit(qa.prepare_context, transcript)
+        executor.shutdown(wait=False)
+        
         # Generate suggested questions
-        suggestions = generate_suggested_questions(transcript)
+        suggestions = qa.generate_suggested_questions(transcript)
         print(f"\n💡 Suggested questions:")
         for i, suggestion in enumerate(suggestions, 1):
             print(f"  {i}. {suggestion}")
@@ -149,14 +185,18 @@ def interactive_qa_session():
         # Interactive Q&A loop
         print(f"\n🤖 Ask questions about the transcript (type 'quit' to exit):")
         while True:
-            question = input("\nYour question: ").strip()
+            try:
+                question = input("\nYour question: ").strip()
+            except EOFError:
+                break
             if question.lower() in ['quit', 'exit', 'stop']:
                 break
             
             if not question:
                 continue
             
-            result = answer_question(transcript, question)
+            # Only the first question can still be waiting on the preparation
+            result = qa.answer_prepared(pending_handle.result(), question)
             print(f"\n🤖 Answer: {result['answer']}")
             print(f"📊 Confidence: {result['confidence']:.2f}")
             
@@ -178,7 +218,8 @@ if __name__ == "__main__":
     print("1. Debug specific Q&A performance")
     print("2. Interactive Q&A session")
     
-    choice = input("Enter choice (1 or 2): ").strip()
+    # A piped transcript goes straight to the debug analysis
+    choice = input("Enter choice (1 or 2): ").strip() if sys.stdin.isatty() else "1"
     
     if choice == "1":
         debug_qa_performance()
@@ -0,0 +1,32 @@
+# export_qa_onnx.py
+"""
+Export the Q&A model to ONNX so QA_USE_ONNX=true starts without exporting
+Requires: pip install optimum[onnxruntime]
+"""
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+def export_model():
+    """Export the configured Q&A model into QA_ONNX_MODEL_DIR"""
+    from app._singleton import get_app
+    
+    with get_app().app_context():
+        from app.services.qa_service import QA_MODEL, export_onnx_model
+        
+        print(f"Exporting {QA_MODEL} to ONNX...")
+        try:
+            export_dir = export_onnx_model()
+        except ImportError as e:
+            print(f"❌ ONNX Runtime is not installed: {e}")
+            print("💡 Install it with: pip install optimum[onnxruntime]")
+            return False
+        
+        print(f"✓ Model exported to {export_dir}")
+        print("Set QA_USE_ONNX=true to serve it with ONNX Runtime")
+        return True
+
+if __name__ == '__main__':
+    sys.exit(0 if export_model() else 1)
@@ -0,0 +1,30 @@
+# migrations/add_qa_session_index.py
+"""
+Database migration script to add the Q&A history index to qa_sessions
+db.create_all() does not add indexes to tables that already exist
+"""
+
+import os
+import sys
+
+# Add the parent directory to Python path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db
+from app.models.qa_session import QASession
+
+def migrate_database():
+    """Create the composite (recording_id, user_id, created_at) index"""
+    app = create_app(load_models=False)
+    
+    with app.app_context():
+        print("Creating qa_sessions indexes...")
+        
+        for index in QASession.__table__.indexes:
+            index.create(bind=db.engine, checkfirst=True)
+        
+        print("qa_sessions indexes created successfully!")
+        print("Migration completed.")
+
+if __name__ == '__main__':
+    migrate_database()
\ No newline at end of file
@@ -17,7 +17,8 @@ from app.models.qa_session import QASession
 
 def migrate_database():
     """Create the qa_sessions table"""
-    app = create_app()
+    # Only the tables are needed, skip importing and loading the ML models
+    app = create_app(load_models=False)
     
     with app.app_context():
         print("Creating qa_sessions table...")
@@ -4,29 +4,53 @@ Setup script for the Q&A feature
 This script will install dependencies and run migrations
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
 
 def run_command(command, description):
-    """Run a command and handle errors"""
+    """
+    Run a setup step and handle errors
+    
+    Args:
+        command (list or callable): Arguments for a subprocess, run without a
+            shell and with its output streamed live, or a function run in-process
+        description (str): Step name shown to the user
+    """
     print(f"\n{description}...")
     try:
-        if isinstance(command, str):
-            # For Windows PowerShell
-            result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        if callable(command):
+            command()
         else:
-            result = subprocess.run(command, check=True, capture_output=True, text=True)
+            subprocess.run(command, check=True)
         print(f"✓ {description} completed successfully")
         return True
-    except subprocess.CalledProcessError as e:
+    except Exception as e:  # CalledProcessError, or whatever the in-process step raised
         print(f"✗ Error during {description.lower()}: {e}")
-        if e.stdout:
-            print(f"Output: {e.stdout}")
-        if e.stderr:
-            print(f"Error: {e.stderr}")
         return False
 
+def install_command():
+    """Install requirements.txt with uv when it is available, pip otherwise"""
+    if importlib.util.find_spec('uv') is not None:
+        return [sys.executable, '-m', 'uv', 'pip', 'install', '--python', sys.executable, '-r', 'requirements.txt']
+    return [sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt']
+
+def run_migration():
+    """Create the qa_sessions table in this process instead of a new interpreter"""
+    from migrations.add_qa_sessions import migrate_database
+    migrate_database()
+
+def download_models():
+    """Fetch the model weights now so the first question doesn't download them"""
+    if importlib.util.find_spec('hf_transfer') is not None:
+        os.environ.setdefault('HF_HUB_ENABLE_HF_TRANSFER', '1')  # Faster parallel downloads
+    
+    from app import create_app
+    from app.services import qa_service
+    qa_service.init_app(create_app(load_models=False))
+    qa_service.download_models()
+
 def main():
     print("🤖 Setting up Q&A Feature for Speech Recognition App")
     print("=" * 50)
@@ -40,8 +64,9 @@ def main():
     
     # Install new dependencies
     commands = [
-        ("pip install sentence-transformers==2.2.2", "Installing sentence-transformers"),
-        ("python migrations/add_qa_sessions.py", "Running database migration"),
+        (install_command(), "Installing dependencies"),
+        (run_migration, "Running database migration"),
+        (download_models, "Downloading Q&A models"),
     ]
     
     success_count = 0
@@ -59,6 +84,7 @@ def main():
         print("- Q&A interface accessible from transcript results")
         print("- Q&A history and suggested questions")
         print("- Confidence scores for AI answers")
+        print("- Faster CPU answers with an int8-quantized model (set QA_QUANTIZE=false to disable)")
         
         print("\n🚀 How to Use:")
         print("1. Transcribe an audio file as usual")
@@ -67,7 +93,7 @@ def main():
         print("4. View Q&A history in the dashboard")
         
         print("\n⚠️  Note:")
-        print("- First Q&A query may take longer as the model downloads")
+        print("- First Q&A query may take longer as the model loads into memory")
         print("- Model requires ~250MB of disk space")
         print("- Best results with clear, specific questions")
         
@@ -11,9 +11,8 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 def initialize_flask_context():
     """Initialize Flask application context for testing"""
     try:
-        from app import create_app
-        app = create_app()
-        return app.app_context()
+        from app._singleton import get_app
+        return get_app().app_context()
     except Exception as e:
         print(f"Warning: Could not initialize Flask context: {e}")
         return None
@@ -50,21 +49,22 @@ def test_qa_service():
         
         print(f"Testing with {len(questions)} questions...\n")
         
-        for i, question in enumerate(questions, 1):
+        # Answer all questions in one batched call
+        try:
+            results = qa_service.answer_questions_batch(questions, transcript)
+        except Exception as e:
+            print(f" ERROR: {e}")
+            results = [None] * len(questions)
+        
+        for i, (question, result) in enumerate(zip(questions, results), 1):
             print(f"Question {i}: {question}")
             
-            try:
-                result = qa_service.answer_question(question, transcript)
-                
-                if result and result.get('answer'):
-                    print(f"Answer: {result['answer']}")
-                    print(f"Confidence: {result.get('confidence', 0):.2f}")
-                    print(" SUCCESS")
-                else:
-                    print(" FAILED - No answer returned")
-                    
-            except Exception as e:
-                print(f" ERROR: {e}")
+            if result and result.get('answer'):
+                print(f"Answer: {result['answer']}")
+                print(f"Confidence: {result.get('confidence', 0):.2f}")
+                print(" SUCCESS")
+            else:
+                print(" FAILED - No answer returned")
                 
             print("-" * 30)
         